@@ -17,10 +17,12 @@
 """diceware_list -- wordlists for diceware.
 """
 import argparse
+import functools
 import itertools
 import logging
 import math
 import string
+import sys
 from diceware_list.libwordlist import (
     DICE_SIDES,
     base_terms_iterator,
@@ -42,9 +44,12 @@ DEFAULT_PREFIX = PREFIX_OPTIONS[0]
 DEFAULT_CHARS = string.ascii_letters + string.digits + string.punctuation
 
 
-def get_cmdline_args(args=None):
-    """Handle commandline options."""
-    parser = argparse.ArgumentParser(description="Create a wordlist")
+@functools.lru_cache(maxsize=None)
+def get_cmdline_parser():
+    """Get the parser for commandline options."""
+    parser = argparse.ArgumentParser(
+        prog="diceware-list", description="Create a wordlist"
+    )
     parser.add_argument(
         "-l",
         "--length",
@@ -133,7 +138,12 @@ def get_cmdline_args(args=None):
         version=__version__,
         help="output version information and exit.",
     )
-    return parser.parse_args(args)
+    return parser
+
+
+def get_cmdline_args(args=None):
+    """Handle commandline options."""
+    return get_cmdline_parser().parse_args(args)
 
 
 def generate_wordlist(
@@ -203,15 +213,15 @@ def generate_wordlist(
     base_terms = base_terms_iterator(use_kit=use_kit, use_416=use_416)
     terms = itertools.chain(input_terms, base_terms)
     if lowercase:
-        terms = [x.lower() for x in terms]
-    terms = sorted(set(terms))
+        terms = (x.lower() for x in terms)
+    terms = list(set(terms))  # `min_width_iter` sorts terms itself
     if not use_kit and not use_416:
         min_word_len = min_word_len or min_word_length(terms, length)
         terms = list(min_length_iter(terms, min_word_len))
     if prefix_code in ("short", "long"):
         prefer_short = prefix_code == "short"
         terms = list(
-            strip_matching_prefixes(terms, is_sorted=True, prefer_short=prefer_short)
+            strip_matching_prefixes(terms, is_sorted=False, prefer_short=prefer_short)
         )
     if length is None:
         length = len(terms)
@@ -248,7 +258,7 @@ def main():
         logger.addHandler(logging.StreamHandler())
         logger.debug("Verbose logging enabled")
         logger.info("Creating wordlist...")
-    for term in generate_wordlist(
+    terms = generate_wordlist(
         all_terms,
         args.length,
         use_kit=args.use_kit,
@@ -260,8 +270,9 @@ def main():
         lowercase=not args.uppercase,
         chars=args.chars,
         min_word_len=args.min_wordlen,
-    ):
-        print(term)
+    )
+    # write all terms at once instead of calling `print()` per term.
+    sys.stdout.write("".join("%s\n" % term for term in terms))
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -28,8 +28,9 @@ try:
 except ImportError:  # pragma: no cover
     from urlparse import urlparse  # python 2.x
 import base64
-import codecs
+import collections
 import decimal
+import functools
 import itertools
 import logging
 import math
@@ -55,9 +56,9 @@ logger = logging.getLogger("libwordlist")
 logger.addHandler(logging.NullHandler())
 
 
-def normalize(text):
-    """Normalize text."""
-    TRANSFORMS = {
+#: Substitutions applied before unicode normalization in `normalize()`.
+TRANSFORMS = str.maketrans(
+    {
         "ä": "ae",
         "Ä": "AE",
         "æ": "ae",
@@ -73,9 +74,40 @@ def normalize(text):
         "Đ": "D",
         "đ": "d",
     }
-    transformed = "".join([TRANSFORMS.get(x, x) for x in text])
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_combining_table():
+    """Get a `str.translate` table that deletes all combining chars.
+
+    The table is computed on first use, as this takes some time.
+    """
+    return dict.fromkeys(
+        cp for cp in range(sys.maxunicode + 1) if unicodedata.combining(chr(cp))
+    )
+
+
+@functools.lru_cache(maxsize=1 << 17)
+def normalize(text):
+    """Normalize text.
+
+    We use NFKD (and not NFC or NFD) on purpose: compatibility chars like
+    ``ĳ`` or ``ſ`` should turn into plain ``ij`` and ``s``, while
+    combining chars are stripped afterwards.
+
+    Pure ASCII text is returned unchanged after the `TRANSFORMS`
+    substitution step, as it is stable under NFKD and contains no
+    combining chars.
+
+    Results are cached, as wordlists tend to contain the same terms
+    over and over again. Use `normalize.cache_clear()` to free memory.
+    """
+    transformed = text.translate(TRANSFORMS)
+    if transformed.isascii():
+        return transformed
     nfkd_form = unicodedata.normalize("NFKD", transformed)
-    return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+    return nfkd_form.translate(get_combining_table())
 
 
 def base10_to_n(num, base):
@@ -119,11 +151,11 @@ def filter_chars(iter, allowed=None):
     else:
         logger.info("Filtering out chars.")
         logger.debug("  Allowed chars: %r" % allowed)
+        allowed_set = frozenset(allowed)
         line = 0
         for elem in iter:
             line += 1
-            stripped = [x for x in elem if x in allowed]
-            if len(stripped) >= len(elem):
+            if allowed_set.issuperset(elem):
                 yield elem
             else:
                 logger.debug("  Not allowed char in line %d" % line)
@@ -179,14 +211,17 @@ def idx_to_dicenums(item_index, dice_num, dice_sides=DICE_SIDES, separator="-"):
         '212'
 
     """
-    nums = [x + 1 for x in base10_to_n(item_index, dice_sides)]
-    padded = [
-        1,
-    ] * dice_num + nums
-    return separator.join(["%s" % x for x in padded[-dice_num:]])
+    if dice_num < 1:  # no padding, use all digits
+        nums = base10_to_n(item_index, dice_sides)
+        return separator.join([str(x + 1) for x in nums])
+    result = [""] * dice_num
+    for pos in range(dice_num - 1, -1, -1):  # least significant die first
+        item_index, num = divmod(item_index, dice_sides)
+        result[pos] = str(num + 1)
+    return separator.join(result)
 
 
-def shuffle_max_width_items(word_list, max_width=None):
+def shuffle_max_width_items(word_list, max_width=None, keep=None):
     """Shuffle entries of `word_list` that have max width.
 
     Yields items in `word_list` in preserved order, but with maximum
@@ -205,14 +240,26 @@ def shuffle_max_width_items(word_list, max_width=None):
 
     That means the three maximum-width elements at the end are returned
     in different order.
+
+    If `keep` is given, only a random sample of `keep` maximum-width
+    elements is returned. This is cheaper than shuffling all of them if
+    only a few are needed.
     """
     word_list = [x.strip() for x in word_list]
     if max_width is None:
-        max_width = len(max(word_list, key=len))
-    for entry in filter(lambda x: len(x) < max_width, word_list):
-        yield entry
-    max_width_entries = list(filter(lambda x: len(x) == max_width, word_list))
-    random.shuffle(max_width_entries)
+        max_width = max(map(len, word_list), default=0)
+    max_width_entries = []
+    for entry in word_list:
+        width = len(entry)
+        if width < max_width:
+            yield entry
+        elif width == max_width:
+            max_width_entries.append(entry)
+    if keep is None:
+        random.shuffle(max_width_entries)
+    else:
+        keep = max(0, min(keep, len(max_width_entries)))
+        max_width_entries = random.sample(max_width_entries, keep)
     for entry in max_width_entries:
         yield entry
 
@@ -242,7 +289,7 @@ def paths_iterator(paths):
             for term in term_iterator([sys.stdin]):
                 yield term
         else:
-            with codecs.open(path, "r", encoding="utf-8") as fd:
+            with open(path, "r", encoding="utf-8") as fd:
                 for term in term_iterator([fd]):
                     yield term
 
@@ -297,12 +344,26 @@ def min_width_iter(iterator, num, shuffle_max_width=True, min_len=0):
     length first and terms of same length sorted alphabetically.
 
     """
-    all_terms = sorted(
-        filter(lambda x: len(x) >= min_len, iterator), key=lambda x: (len(x), x)
-    )
+    terms = [x for x in iterator if len(x) >= min_len]
+    if num < 1 or not terms:
+        return
+    # find the width of the `num`-th term by counting lengths. Only terms up
+    # to that width are sorted, which is much less than the whole list for
+    # `num` << ``len(terms)``.
+    max_width, count, short_count = 0, 0, 0
+    for max_width, cnt in sorted(collections.Counter(map(len, terms)).items()):
+        short_count = count
+        count += cnt
+        if count >= num:
+            break
+    # sort alphabetically first, then (stable) by length. This gives the same
+    # order as a `(len(x), x)` key without building a tuple per term.
+    all_terms = sorted(x for x in terms if len(x) <= max_width)
+    all_terms.sort(key=len)
     if shuffle_max_width:
-        max_width = len(all_terms[num - 1])
-        all_terms = shuffle_max_width_items(all_terms, max_width)
+        all_terms = shuffle_max_width_items(
+            all_terms, max_width, keep=num - short_count
+        )
     for term in itertools.islice(all_terms, num):  # yield first num terms...
         yield term
 
@@ -676,7 +737,8 @@ class AndroidWordList(object):
         if self.path is None:
             url = self.full_url % self.lang
         logger.info("Fetching wordlist from %s" % url)
-        data = urlopen(url).read()
+        with urlopen(url) as resp:
+            data = resp.read()
         if self.path is None:
             # the android `gitiles` repo provides files only base64 encoded.
             data = base64.b64decode(data)
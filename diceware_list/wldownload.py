@@ -18,6 +18,7 @@
 """
 from __future__ import unicode_literals, print_function
 import argparse
+import functools
 import logging
 import os
 import sys
@@ -30,10 +31,11 @@ except NameError:  # pragma: no cover
     BrokenPipeError = IOError  # Python 2.x
 
 
-def get_cmdline_args(args=None):
-    """Handle commandline options for `wldownload`."""
+@functools.lru_cache(maxsize=None)
+def get_cmdline_parser():
+    """Get the parser for `wldownload` commandline options."""
     parser = argparse.ArgumentParser(
-        description="Download and mangle Android wordlists"
+        prog="wldownload", description="Download and mangle Android wordlists"
     )
     parser.add_argument("-o", "--outfile", action="store", help="file to store output.")
     parser.add_argument(
@@ -63,7 +65,12 @@ def get_cmdline_args(args=None):
         version=__version__,
         help="output version information and exit.",
     )
-    return parser.parse_args(args)
+    return parser
+
+
+def get_cmdline_args(args=None):
+    """Handle commandline options for `wldownload`."""
+    return get_cmdline_parser().parse_args(args)
 
 
 def get_save_path(word_list, outfile=None, lang="en"):
@@ -89,21 +96,33 @@ def download_wordlist(
     """Download and mangle remote wordlists."""
     wl = AndroidWordList(lang=lang)
     path = get_save_path(wl, outfile, lang)
-    if os.path.exists(path) and (raw or outfile):
-        logger.error("cannot create '%s': File exists" % path)
-        sys.exit(73)  # 73 is the EX_CANTCREAT exit code
+    fd = None
+    if raw or outfile:
+        try:
+            # exclusive creation: fail early and race-free on existing files
+            fd = open(path, "xb" if raw else "x")
+        except FileExistsError:
+            logger.error("cannot create '%s': File exists" % path)
+            sys.exit(73)  # 73 is the EX_CANTCREAT exit code
     logger.info("Starting download of Android wordlist file.")
-    wl.download()
+    try:
+        wl.download()
+    except BaseException:
+        if fd is not None:
+            fd.close()
+            os.remove(path)
+        raise
     if raw:
         logger.debug("Download finished. Path: %s" % path)
-        wl.save(path)
+        with fd:
+            fd.write(wl.gz_data)
         logger.info("Done.")
     else:
         offensive = None
         if filter_offensive:
             offensive = False  # no-filtering is signalled by None
         if outfile:
-            with open(path, "w") as fd:
+            with fd:
                 for word in wl.get_words(offensive=offensive):
                     fd.write(word)
                     fd.write("\n")
@@ -18,6 +18,7 @@
 """
 from __future__ import unicode_literals
 import argparse
+import functools
 from diceware_list import __version__
 from diceware_list.libwordlist import (
     get_matching_prefixes,
@@ -26,9 +27,12 @@ from diceware_list.libwordlist import (
 )
 
 
-def get_cmdline_args(args=None):
-    """Handle commandline options for `wlflakes`."""
-    parser = argparse.ArgumentParser(description="Find flakes in diceware wordlists")
+@functools.lru_cache(maxsize=None)
+def get_cmdline_parser():
+    """Get the parser for `wlflakes` commandline options."""
+    parser = argparse.ArgumentParser(
+        prog="wlflakes", description="Find flakes in diceware wordlists"
+    )
     parser.add_argument(
         "wordlistfile",
         nargs="+",
@@ -52,7 +56,12 @@ def get_cmdline_args(args=None):
         version=__version__,
         help="output version information and exit.",
     )
-    return parser.parse_args(args)
+    return parser
+
+
+def get_cmdline_args(args=None):
+    """Handle commandline options for `wlflakes`."""
+    return get_cmdline_parser().parse_args(args)
 
 
 def find_flakes(file_descriptors, prefixes=True):
@@ -22,6 +22,7 @@ import decimal
 import logging
 import os
 import pytest
+import random
 import shutil
 import sys
 
@@ -151,6 +152,20 @@ def local_index(request, monkeypatch, tmpdir):
     return tmpdir
 
 
+@pytest.fixture(scope="function")
+def no_shuffle(monkeypatch):
+    """Make `random.shuffle` and `random.sample` keep the given order."""
+    monkeypatch.setattr(random, "shuffle", lambda x: x)
+    monkeypatch.setattr(random, "sample", lambda x, k: x[:k])
+
+
+@pytest.fixture(scope="function")
+def reverse_shuffle(monkeypatch):
+    """Make `random.shuffle` and `random.sample` reverse the given order."""
+    monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
+    monkeypatch.setattr(random, "sample", lambda x, k: x[::-1][:k])
+
+
 @pytest.fixture(scope="function")
 def home_dir(request, monkeypatch, tmpdir):
     """This fixture provides a temporary user home.
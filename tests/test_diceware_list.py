@@ -18,8 +18,13 @@
 """
 import sys
 import pytest
-import random
-from diceware_list import get_cmdline_args, generate_wordlist, main, __version__
+from diceware_list import (
+    get_cmdline_args,
+    get_cmdline_parser,
+    generate_wordlist,
+    main,
+    __version__,
+)
 
 
 class TestHelpers(object):
@@ -30,6 +35,19 @@ class TestHelpers(object):
 
 class TestArgParser(object):
 
+    def test_parser_is_reused(self):
+        # the commandline parser is built only once
+        assert get_cmdline_parser() is get_cmdline_parser()
+
+    def test_parser_prog(self, monkeypatch, capfd):
+        # the script name in usage messages does not depend on `sys.argv`
+        for name in ("first-script", "second-script"):
+            monkeypatch.setattr(sys, "argv", [name])
+            with pytest.raises(SystemExit):
+                get_cmdline_args()
+            out, err = capfd.readouterr()
+            assert err.startswith("usage: diceware-list ")
+
     def test_sys_argv_as_fallback(self, monkeypatch, capfd, dictfile):
         # if we deliver no args, `sys.argv` is used.
         monkeypatch.setattr(sys, "argv", ["scriptname", str(dictfile)])
@@ -183,9 +201,8 @@ class TestArgParser(object):
 
 class TestGenerateWordlist(object):
 
-    def test_arg_length_is_respected(self, monkeypatch):
+    def test_arg_length_is_respected(self, reverse_shuffle):
         # we respect the "length" parameter
-        monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
         in_list = ["a", "b", "c"]
         assert list(generate_wordlist(in_list, length=0)) == []
         assert list(generate_wordlist(in_list, length=1, use_kit=False)) == [
@@ -217,9 +234,8 @@ class TestGenerateWordlist(object):
         assert "a" in default
         assert "b" in default
 
-    def test_arg_use_kit_is_respected(self, monkeypatch):
+    def test_arg_use_kit_is_respected(self, no_shuffle):
         # we respect the "use_kit" parameter
-        monkeypatch.setattr(random, "shuffle", lambda x: x)
         result1 = list(generate_wordlist(["a", "b"], length=3, use_kit=True))
         result2 = list(generate_wordlist(["a", "b"], length=2, use_kit=False))
         result_default = list(generate_wordlist(["a", "b"], length=2))
@@ -227,9 +243,8 @@ class TestGenerateWordlist(object):
         assert "!" not in result2
         assert "!" not in result_default
 
-    def test_arg_use_416_is_respected(self, monkeypatch):
+    def test_arg_use_416_is_respected(self, no_shuffle):
         # we respect the "use_416" parameter
-        monkeypatch.setattr(random, "shuffle", lambda x: x)
         result1 = list(
             generate_wordlist(["a", "b"], length=3, use_kit=False, use_416=True)
         )
@@ -261,9 +276,22 @@ class TestGenerateWordlist(object):
         assert len(numbered_list[0].split()) == 2
         assert len(default_list[0].split()) == 1
 
-    def test_arg_ascii_only_is_respected(self, monkeypatch):
+    def test_arg_numbered_single_term(self):
+        # a single term list is numbered as well
+        result = list(
+            generate_wordlist(
+                ["aa"],
+                length=1,
+                use_kit=False,
+                use_416=False,
+                numbered=True,
+                shuffle_max=False,
+            )
+        )
+        assert result == ["1 aa"]
+
+    def test_arg_ascii_only_is_respected(self, no_shuffle):
         # we respect ascii_only.
-        monkeypatch.setattr(random, "shuffle", lambda x: x)
         terms = ["aa", "aä", "ba"]
         unfiltered_list = list(
             generate_wordlist(
@@ -282,9 +310,8 @@ class TestGenerateWordlist(object):
         assert filtered_list == ["aa", "ba"]
         assert default_list == unfiltered_list
 
-    def test_arg_shuffle_max_is_respected(self, monkeypatch):
+    def test_arg_shuffle_max_is_respected(self, reverse_shuffle):
         # we can switch shuffling on or off.
-        monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
         terms = ["a", "b", "c"]
         unshuffled_list = list(
             generate_wordlist(
@@ -303,9 +330,8 @@ class TestGenerateWordlist(object):
         assert shuffled_list == ["b", "c"]
         assert default_list == shuffled_list
 
-    def test_arg_sides_is_respected(self, monkeypatch):
+    def test_arg_sides_is_respected(self, no_shuffle):
         # we can choose how much sides the used dice have
-        monkeypatch.setattr(random, "shuffle", lambda x: x)
         terms = ["a", "b", "c", "d", "e", "f", "g"]
         sides_2_list = list(
             generate_wordlist(
@@ -336,9 +362,8 @@ class TestGenerateWordlist(object):
         assert sides_3_list == ["11 a", "12 b", "13 c", "21 d", "22 e", "23 f"]
         assert default_list == ["11 a", "12 b", "13 c", "14 d", "15 e", "16 f", "21 g"]
 
-    def test_arg_delimiter_default(self, monkeypatch):
+    def test_arg_delimiter_default(self, no_shuffle):
         # we can choose how numbered output separates numbers.
-        monkeypatch.setattr(random, "shuffle", lambda x: x)
         terms = ["w%s" % x for x in range(7)]  # ['w0'..'w6']
         default_list = list(
             generate_wordlist(
@@ -355,9 +380,8 @@ class TestGenerateWordlist(object):
             "21 w6",
         ]
 
-    def test_arg_delimiter_more_than_9_sides(self, monkeypatch):
+    def test_arg_delimiter_more_than_9_sides(self, no_shuffle):
         # with more than 9 sides, we output dashes in numbered output
-        monkeypatch.setattr(random, "shuffle", lambda x: x)
         terms = ["w%02d" % x for x in range(11)]  # ['w00'..'w10']
         d10_list = list(
             generate_wordlist(
@@ -383,9 +407,8 @@ class TestGenerateWordlist(object):
             "2-1 w10",
         ]
 
-    def test_arg_prefix_code_is_respected(self, monkeypatch):
+    def test_arg_prefix_code_is_respected(self, no_shuffle):
         # we can tell whether prefix code should be generated
-        monkeypatch.setattr(random, "shuffle", lambda x: x)
         terms = ["XXXXa", "XXXXaa", "XXXXba", "XXXXca"]
         result1 = list(
             generate_wordlist(
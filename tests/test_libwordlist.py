@@ -26,7 +26,6 @@ from io import StringIO
 import codecs
 import decimal
 import gzip
-import random
 import pytest
 import sys
 from diceware_list import DEFAULT_CHARS
@@ -35,6 +34,7 @@ from diceware_list.libwordlist import (
     base10_to_n,
     filter_chars,
     base_terms_iterator,
+    get_combining_table,
     idx_to_dicenums,
     min_width_iter,
     normalize,
@@ -50,6 +50,7 @@ from diceware_list.libwordlist import (
     entropy_per_char_bruteforce,
     min_word_length,
     min_length_iter,
+    TRANSFORMS,
 )
 
 
@@ -124,6 +125,9 @@ def test_idx_to_dicenums():
     assert idx_to_dicenums(0, 3) == "1-1-1"  # default
     assert idx_to_dicenums(0, 3, separator="sep") == "1sep1sep1"
     assert idx_to_dicenums(0, 3, separator="") == "111"
+    # without dice number all digits are returned
+    assert idx_to_dicenums(0, 0) == "1"
+    assert idx_to_dicenums(6, 0) == "2-1"
 
 
 def test_idx_to_dicenums_gives_text():
@@ -132,9 +136,8 @@ def test_idx_to_dicenums_gives_text():
     assert isinstance(result, type("text"))
 
 
-def test_min_width_iter(monkeypatch):
+def test_min_width_iter(no_shuffle):
     # we can get iterators with minimal list width.
-    monkeypatch.setattr(random, "shuffle", lambda x: x)
     assert list(min_width_iter(["bb", "a", "ccc", "dd"], 3)) == ["a", "bb", "dd"]
     assert list(min_width_iter(["c", "a", "b"], 2)) == ["a", "b"]
     assert list(min_width_iter(["c", "a", "b"], 3)) == ["a", "b", "c"]
@@ -143,15 +146,26 @@ def test_min_width_iter(monkeypatch):
     assert list(min_width_iter(["aa", "c", "bb"], 2)) == ["c", "aa"]
 
 
+def test_min_width_iter_few_terms(reverse_shuffle):
+    # we cope with less terms than requested and with empty input
+    assert list(min_width_iter([], 2)) == []
+    assert list(min_width_iter(["bb", "a"], 0)) == []
+    assert list(min_width_iter(["ccc", "bb", "a"], 5)) == ["a", "bb", "ccc"]
+    assert list(min_width_iter(["eee", "a", "dd", "ccc", "bb"], 3)) == [
+        "a",
+        "dd",
+        "bb",
+    ]
+
+
 def test_min_length_iter():
     assert list(min_length_iter(iter([]))) == []
     assert list(min_length_iter(iter([]), 1)) == []
     assert list(min_length_iter(iter(["a", "bb", "ccc"]), 2)) == ["bb", "ccc"]
 
 
-def test_min_width_iter_shuffle_max_widths_values(monkeypatch):
+def test_min_width_iter_shuffle_max_widths_values(reverse_shuffle):
     # words with maximum width are shuffled
-    monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
     assert list(min_width_iter(["a", "aa", "bb"], 2, shuffle_max_width=True)) == [
         "a",
         "bb",
@@ -163,9 +177,8 @@ def test_min_width_iter_shuffle_max_widths_values(monkeypatch):
     assert list(min_width_iter(["aa", "a"], 2, shuffle_max_width=True)) == ["a", "aa"]
 
 
-def test_min_width_iter_discards_min_len_values(monkeypatch):
+def test_min_width_iter_discards_min_len_values(reverse_shuffle):
     # too short terms are discarded
-    monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
     assert sorted(
         list(
             min_width_iter(
@@ -196,6 +209,15 @@ def test_min_width_iter_discards_min_len_values(monkeypatch):
     ) in (["aa", "ccc"], ["aa", "ddd"])
 
 
+def test_get_combining_table():
+    # we get a table to delete combining chars with `str.translate`
+    table = get_combining_table()
+    assert table[0x0301] is None  # combining acute accent
+    assert 0x0065 not in table  # 'e'
+    assert "e\u0301\u0308".translate(table) == "e"
+    assert get_combining_table() is table
+
+
 def test_normalize():
     # we can normalize texts.
     assert normalize("ªºÀÁÂÃÄÅÆ") == "aoAAAAAEAAE"
@@ -214,6 +236,21 @@ def test_normalize():
     assert normalize("ŴŵŶŷŸŹźŻżŽžſ") == "WwYyYZzZzZzs"
     # "þĦħĦħıĸŁłŊŋŉŒœŦŧƀƁƂƃƄƅƆƇƈƉƊƋƌƍ""
     assert normalize("mäßig") == "maessig"
+    # pure ASCII is returned unchanged
+    assert normalize("far-out 42") == "far-out 42"
+
+
+def test_normalize_compatibility_chars():
+    # compatibility chars are decomposed, not only canonical ones
+    assert normalize("ĳſﬁ²") == "ijsfi2"
+    assert normalize("e\u0301") == normalize("\u00e9") == "e"
+
+
+def test_transforms():
+    # the substitution table works with `str.translate`, also for 1:n mappings
+    assert "Straße".translate(TRANSFORMS) == "Strasse"
+    assert "ÄÖÜ äöü Đđ".translate(TRANSFORMS) == "AEOEUE aeoeue Dd"
+    assert "plain".translate(TRANSFORMS) == "plain"
 
 
 def test_normalize_gives_text():
@@ -223,11 +260,19 @@ def test_normalize_gives_text():
     assert isinstance(normalize(str("far")), type("text"))
 
 
-def test_shuffle_max_width_items(monkeypatch):
+def test_normalize_caches_results():
+    # repeated terms are normalized only once
+    normalize.cache_clear()
+    assert normalize("fär") == normalize("fär") == "faer"
+    assert normalize.cache_info().hits == 1
+    normalize.cache_clear()
+    assert normalize.cache_info().currsize == 0
+
+
+def test_shuffle_max_width_items(reverse_shuffle):
     # we can shuffle the max width items of a list
-    # install a pseudo-shuffler that generates predictable orders
-    # so that last elements are returned in reverse order.
-    monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
+    # the pseudo-shuffler installed by `reverse_shuffle` generates
+    # predictable orders: last elements are returned in reverse order.
     # an ordered list
     result = list(shuffle_max_width_items(["a", "aa", "bb", "cc"]))
     assert result == ["a", "cc", "bb", "aa"]
@@ -242,11 +287,22 @@ def test_shuffle_max_width_items(monkeypatch):
     # a list with one length only
     result = list(shuffle_max_width_items(["aa", "bb", "cc"]))
     assert result == ["cc", "bb", "aa"]
+    # an empty list
+    assert list(shuffle_max_width_items([])) == []
 
 
-def test_shuffle_max_width_items_copes_with_files(monkeypatch, tmpdir):
+def test_shuffle_max_width_items_keep(reverse_shuffle):
+    # we can restrict the number of max width items returned
+    result = list(shuffle_max_width_items(["a", "aa", "bb", "cc"], keep=2))
+    assert result == ["a", "cc", "bb"]
+    result = list(shuffle_max_width_items(["a", "aa", "bb"], keep=5))
+    assert result == ["a", "bb", "aa"]
+    result = list(shuffle_max_width_items(["a", "aa", "bb"], keep=0))
+    assert result == ["a"]
+
+
+def test_shuffle_max_width_items_copes_with_files(reverse_shuffle, tmpdir):
     # when shuffling max width entries we accept file input
-    monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
     wlist = tmpdir.join("wlist.txt")
     wlist.write(b"\n".join([b"a", b"bb", b"cc"]))
     with open(str(wlist), "rb") as fd:
@@ -343,6 +399,13 @@ class TestPathsIterator(object):
         )
         assert result == ["a", "b", "c"]
 
+    def test_paths_iterator_splits_on_newlines_only(self, tmpdir):
+        # other unicode line boundaries are part of terms
+        wlist = tmpdir.join("wlist.txt")
+        wlist.write_text("foo\u2028bar\nbaz\x0cqux\r\n", "utf-8")
+        result = list(paths_iterator([str(wlist)]))
+        assert result == ["foo\u2028bar", "baz\x0cqux"]
+
     def test_multiple_paths(self, tmpdir):
         # the paths iterator can cope with several files
         wlist1 = tmpdir.join("wlist1.txt")
@@ -96,6 +96,32 @@ class TestDowmloadWordlist(object):
         assert "hardore" not in out
         assert "BrokenPipeError caught" in err
 
+    def test_download_wordlist_existing_file_fails_early(
+        self, home_dir, local_android_download_b64, monkeypatch
+    ):
+        # existing target files are detected before downloading anything
+        def mock_download(self):
+            raise AssertionError("download must not happen")
+
+        monkeypatch.setattr(AndroidWordList, "download", mock_download)
+        (home_dir / "foo").write("foo")
+        with pytest.raises(SystemExit) as why:
+            download_wordlist(outfile="foo")
+        assert why.value.code == 73
+        assert (home_dir / "foo").read() == "foo"
+
+    def test_download_wordlist_failed_download_removes_file(
+        self, home_dir, local_android_download_b64, monkeypatch
+    ):
+        # no (empty) target file is left if the download fails
+        def mock_download(self):
+            raise IOError("network down")
+
+        monkeypatch.setattr(AndroidWordList, "download", mock_download)
+        with pytest.raises(IOError):
+            download_wordlist(raw=True)
+        assert not (home_dir / "en_wordlist.combined.gz").exists()
+
 
 class TestArgParser(object):
 